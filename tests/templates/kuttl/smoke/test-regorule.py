@@ -1,6 +1,10 @@
 #!/usr/bin/env python
 import requests
 import argparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+EXPECTED_RESPONSE = {'result': {'hello': True}}
 
 
 if __name__ == "__main__":
@@ -27,11 +31,20 @@ if __name__ == "__main__":
     # --> {'hello': True}
 
     #url = 'http://test-opa-svc:8081/v1/data/test'
-    response = requests.post(args['url']).json()
+    # Retry transient failures, e.g. connection resets while OPA is starting up
+    retry = Retry(total=3, connect=3, read=3, backoff_factor=0.1, status_forcelist=[502, 503, 504], allowed_methods=["POST"])
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(max_retries=retry))
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    try:
+        response = session.post(args['url'], json={'input': {}}, timeout=(2, 5)).json()
+    finally:
+        session.close()
 
-    if "result" in response and "hello" in response["result"] and response["result"]["hello"]:
+    result = response.get("result", {})
+    if "hello" in result and result["hello"]:
         print("Test successful!")
         exit(0)
     else:
-        print("Error: received " + str(response) + " - expected: {'result': {'hello': True}}")
+        print("Error: received " + str(response) + " - expected: " + str(EXPECTED_RESPONSE))
         exit(-1)